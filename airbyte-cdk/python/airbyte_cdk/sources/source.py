@@ -61,10 +61,10 @@ class Source(
             state_obj = BaseConnector._read_json_file(state_path)
             if state_obj:
                 for state in state_obj:  # type: ignore  # `isinstance(state_obj, List)` ensures that this is a list
-                    parsed_message = AirbyteStateMessage.parse_obj(state)
-                    if not parsed_message.stream and not parsed_message.data and not parsed_message.global_:
+                    # Checked on the raw message so that empty messages are rejected without being validated
+                    if isinstance(state, Mapping) and not (state.get("stream") or state.get("data") or state.get("global")):
                         raise ValueError("AirbyteStateMessage should contain either a stream, global, or state field")
-                    parsed_state_messages.append(parsed_message)
+                    parsed_state_messages.append(AirbyteStateMessage.model_validate(state))
         return parsed_state_messages
 
     # can be overridden to change an input catalog
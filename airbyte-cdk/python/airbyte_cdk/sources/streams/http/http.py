@@ -46,6 +46,7 @@ class HttpStream(Stream, CheckpointMixin, ABC):
             api_budget=api_budget or APIBudget(policies=[]),
             authenticator=authenticator,
             use_cache=self.use_cache,
+            use_http2=self.use_http2,
             backoff_strategy=self.get_backoff_strategy(),
             message_repository=InMemoryMessageRepository(),
         )
@@ -85,6 +86,13 @@ class HttpStream(Stream, CheckpointMixin, ABC):
         """
         return False
 
+    @property
+    def use_http2(self) -> bool:
+        """
+        Override if needed. If True, HTTPS requests are multiplexed over HTTP/2 connections. Requires the `http2` extra.
+        """
+        return False
+
     @property
     @abstractmethod
     def url_base(self) -> str:
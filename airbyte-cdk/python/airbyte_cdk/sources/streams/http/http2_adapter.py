@@ -0,0 +1,142 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import http.client
+import io
+from typing import Any, Iterator, List, Mapping, Optional, Tuple, Union
+
+import httpx
+import requests
+from urllib3 import HTTPResponse
+from urllib3.exceptions import ProtocolError
+
+TimeoutType = Optional[Union[float, Tuple[Optional[float], Optional[float]]]]
+
+
+class _HttpxRawStream(io.RawIOBase):
+    """
+    File-like view over the undecoded body of a streamed httpx response, so that it can back a urllib3.HTTPResponse
+    and be read by requests exactly like a response received through the default HTTPAdapter.
+    """
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+        self._chunks: Iterator[bytes] = response.iter_raw()
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        try:
+            while not self._buffer:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    return 0
+                self._buffer = chunk
+        except httpx.TransportError as exception:
+            # requests translates urllib3 protocol errors to ChunkedEncodingError which is retried by the HttpClient
+            raise ProtocolError(str(exception), exception) from exception
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+class _OriginalResponse:
+    """
+    Stands in for the http.client response wrapped by a urllib3.HTTPResponse. requests only extracts the cookies of a response, into the
+    response and into the session, when the raw response wraps one.
+    """
+
+    def __init__(self, headers: List[Tuple[str, str]], body: io.BufferedReader):
+        self.msg = http.client.HTTPMessage()
+        for name, value in headers:
+            self.msg[name] = value
+        self._body = body
+
+    def info(self) -> http.client.HTTPMessage:
+        return self.msg
+
+    def isclosed(self) -> bool:
+        return self._body.closed
+
+    def close(self) -> None:
+        self._body.close()
+
+
+class Http2Adapter(requests.adapters.HTTPAdapter):
+    """
+    Transport adapter sending the requests of a requests.Session through an httpx client, so that the requests to the same host
+    are multiplexed over a single HTTP/2 connection instead of one in-flight request per HTTP/1.1 connection.
+
+    Only the transport is replaced: the session still prepares the requests, handles authentication and caching, and returns
+    requests.Response objects, so error handlers and backoff strategies behave the same. TLS verification, client certificates and
+    proxies are configured on the httpx client and per-request overrides of them are ignored.
+    """
+
+    def __init__(self, pool_maxsize: int, **kwargs: Any):
+        super().__init__(pool_maxsize=pool_maxsize, **kwargs)
+        self._client = httpx.Client(
+            http2=True, limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize), follow_redirects=False
+        )
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: TimeoutType = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        httpx_request = self._client.build_request(
+            method=request.method or "GET",
+            url=request.url or "",
+            headers=request.headers,
+            content=request.body,
+            timeout=self._to_httpx_timeout(timeout),
+        )
+        try:
+            httpx_response = self._client.send(httpx_request, stream=True)
+        except httpx.ConnectTimeout as exception:
+            raise requests.exceptions.ConnectTimeout(exception, request=request) from exception
+        except httpx.ReadTimeout as exception:
+            raise requests.exceptions.ReadTimeout(exception, request=request) from exception
+        except httpx.TimeoutException as exception:
+            raise requests.exceptions.Timeout(exception, request=request) from exception
+        except httpx.TransportError as exception:
+            raise requests.exceptions.ConnectionError(exception, request=request) from exception
+
+        body = io.BufferedReader(_HttpxRawStream(httpx_response))
+        headers = list(httpx_response.headers.multi_items())
+        raw = HTTPResponse(
+            body=body,
+            headers=headers,
+            status=httpx_response.status_code,
+            reason=httpx_response.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+            request_method=request.method,
+            request_url=request.url,
+            original_response=_OriginalResponse(headers, body),
+        )
+        response: requests.Response = self.build_response(request, raw)
+        return response
+
+    def close(self) -> None:
+        self._client.close()
+        super().close()
+
+    @staticmethod
+    def _to_httpx_timeout(timeout: TimeoutType) -> httpx.Timeout:
+        # requests does not time out by default and uses a (connect, read) tuple while httpx defaults to 5 seconds
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return httpx.Timeout(None, connect=connect_timeout, read=read_timeout)
+        return httpx.Timeout(timeout)
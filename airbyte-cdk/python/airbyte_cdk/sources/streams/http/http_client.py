@@ -4,9 +4,11 @@
 
 import logging
 import os
+import threading
 import urllib
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
 
 import requests
 import requests_cache
@@ -38,9 +40,31 @@ from airbyte_cdk.sources.streams.http.rate_limiting import (
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
+from cachetools import TTLCache
 from requests.auth import AuthBase
 
-BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
+# Both cases are listed so that the method does not need to be upper-cased on every request
+BODY_REQUEST_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "get", "post", "put", "patch"})
+# Applied on top of WAL mode and synchronous=NORMAL which requests-cache sets itself when `wal=True`
+SQLITE_CACHE_PRAGMAS = ("PRAGMA temp_store=MEMORY", "PRAGMA mmap_size=268435456", "PRAGMA cache_size=-65536")
+RESPONSE_CACHE_MAX_SIZE = 256
+RESPONSE_CACHE_TTL_SECONDS = 300
+
+ResponseCacheKey = Tuple[Optional[str], Optional[str], Any, FrozenSet[Tuple[str, str]]]
+
+# In-memory request caches are shared by all the HttpClients of the process so that, like the shared in-memory SQLite database used
+# before, a child stream reuses the responses cached by its parent stream
+_MEMORY_CACHE_RESPONSES: requests_cache.DictStorage = requests_cache.DictStorage()
+_MEMORY_CACHE_REDIRECTS: requests_cache.DictStorage = requests_cache.DictStorage()
+
+
+@lru_cache(maxsize=1024)
+def _parse_query(url: str) -> Dict[str, str]:
+    """
+    Parse the query parameters encoded in the URL, keeping the first value of each parameter.
+    Connectors usually send many requests to the same URL so the result is cached. It is shared between calls and must not be mutated.
+    """
+    return {k: v[0] for k, v in urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).items()}
 
 
 class MessageRepresentationAirbyteTracedErrors(AirbyteTracedException):
@@ -78,6 +102,9 @@ class HttpClient:
         error_message_parser: Optional[ErrorMessageParser] = None,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        pool_connections: int = MAX_CONNECTION_POOL_SIZE,
+        pool_maxsize: int = MAX_CONNECTION_POOL_SIZE,
+        use_http2: bool = False,
     ):
         self._name = name
         self._api_budget: APIBudget = api_budget or APIBudget(policies=[])
@@ -86,9 +113,14 @@ class HttpClient:
         else:
             self._use_cache = use_cache
             self._session = self._request_session()
-            self._session.mount(
-                "https://", requests.adapters.HTTPAdapter(pool_connections=MAX_CONNECTION_POOL_SIZE, pool_maxsize=MAX_CONNECTION_POOL_SIZE)
-            )
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=False)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            if use_http2:
+                # httpx is an optional dependency installed with the `http2` extra. HTTP/2 is only negotiated over TLS
+                from airbyte_cdk.sources.streams.http.http2_adapter import Http2Adapter
+
+                self._session.mount("https://", Http2Adapter(pool_maxsize=pool_maxsize))
         if isinstance(authenticator, AuthBase):
             self._session.auth = authenticator
         self._logger = logger
@@ -100,10 +132,23 @@ class HttpClient:
                 self._backoff_strategies = [backoff_strategy]
         else:
             self._backoff_strategies = [DefaultBackoffStrategy()]
+        self._backoff_time = self._build_backoff_time_resolver(self._backoff_strategies)
         self._error_message_parser = error_message_parser or JsonErrorMessageParser()
-        self._request_attempt_count: Dict[requests.PreparedRequest, int] = {}
         self._disable_retries = disable_retries
         self._message_repository = message_repository
+        # Identical requests sent within a sync are answered from memory instead of rebuilding the response cached by requests-cache
+        self._response_cache: Optional[TTLCache[ResponseCacheKey, requests.Response]] = (
+            TTLCache(maxsize=RESPONSE_CACHE_MAX_SIZE, ttl=RESPONSE_CACHE_TTL_SECONDS) if use_cache else None
+        )
+        self._response_cache_lock = threading.Lock()
+
+        # The retry limits do not change during the lifetime of the client so they are resolved and the backoff decorators built once
+        self._max_retries = self._resolve_max_retries()
+        self._max_tries = max(0, self._max_retries) + 1
+        self._max_time = self._resolve_max_time()
+        self._user_backoff_handler = user_defined_backoff_handler(max_tries=self._max_tries, max_time=self._max_time)
+        self._rate_limit_backoff_handler = rate_limit_default_backoff_handler()
+        self._backoff_handler = http_client_default_backoff_handler(max_tries=self._max_tries, max_time=self._max_time)
 
     @property
     def cache_filename(self) -> str:
@@ -124,18 +169,67 @@ class HttpClient:
             # This is a non-obvious interface, but it ensures we don't write sql files when running unit tests
             if cache_dir:
                 sqlite_path = str(Path(cache_dir) / self.cache_filename)
-            else:
-                sqlite_path = "file::memory:?cache=shared"
-            return CachedLimiterSession(sqlite_path, backend="sqlite", api_budget=self._api_budget)  # type: ignore # there are no typeshed stubs for requests_cache
+                session = CachedLimiterSession(sqlite_path, backend="sqlite", api_budget=self._api_budget, wal=True)  # type: ignore # there are no typeshed stubs for requests_cache
+                self._tune_sqlite_cache(session)
+                return session
+            # Without a persistent cache there is no need to pay for SQLite transactions on every write, a plain dict is enough
+            return CachedLimiterSession(backend=self._shared_memory_cache(), api_budget=self._api_budget)  # type: ignore # there are no typeshed stubs for requests_cache
         else:
             return LimiterSession(api_budget=self._api_budget)
 
+    @staticmethod
+    def _shared_memory_cache() -> requests_cache.BaseCache:
+        # Each session gets its own backend as the session settings are set on it, but all of them read and write the same storage
+        cache = requests_cache.BaseCache()
+        cache.responses = _MEMORY_CACHE_RESPONSES
+        cache.redirects = _MEMORY_CACHE_REDIRECTS
+        return cache
+
+    @staticmethod
+    def _build_backoff_time_resolver(
+        backoff_strategies: List[BackoffStrategy],
+    ) -> Callable[[Optional[Union[requests.Response, requests.RequestException]], int], Optional[float]]:
+        """
+        Return a function computing the backoff time of the first strategy returning one, in the order the strategies were given.
+        Most streams have a single strategy which is then called directly instead of iterating over the list on every retry.
+        """
+        if len(backoff_strategies) == 1:
+            backoff_time = backoff_strategies[0].backoff_time
+            return lambda response_or_exception, attempt_count: backoff_time(
+                response_or_exception=response_or_exception, attempt_count=attempt_count
+            )
+
+        def first_backoff_time(
+            response_or_exception: Optional[Union[requests.Response, requests.RequestException]], attempt_count: int
+        ) -> Optional[float]:
+            for backoff_strategy in backoff_strategies:
+                backoff_time = backoff_strategy.backoff_time(response_or_exception=response_or_exception, attempt_count=attempt_count)
+                if backoff_time:
+                    return backoff_time
+            return None
+
+        return first_backoff_time
+
+    @staticmethod
+    def _tune_sqlite_cache(session: requests_cache.CachedSession) -> None:
+        """
+        Speed up the writes to the SQLite cache and evict the expired responses once per session instead of while sending requests
+        """
+        for table in (session.cache.responses, session.cache.redirects):  # type: ignore # there are no typeshed stubs for requests_cache
+            with table.connection() as connection:
+                for pragma in SQLITE_CACHE_PRAGMAS:
+                    connection.execute(pragma)
+        session.cache.delete(expired=True)  # type: ignore # there are no typeshed stubs for requests_cache
+
     def clear_cache(self) -> None:
         """
         Clear cached requests for current session, can be called any time
         """
-        if isinstance(self._session, requests_cache.CachedSession):
+        if isinstance(self._session, requests_cache.CacheMixin):
             self._session.cache.clear()  # type: ignore # cache.clear is not typed
+        if self._response_cache is not None:
+            with self._response_cache_lock:
+                self._response_cache.clear()
 
     def _dedupe_query_params(self, url: str, params: Optional[Mapping[str, str]]) -> Mapping[str, str]:
         """
@@ -146,11 +240,8 @@ class HttpClient:
         """
         if params is None:
             params = {}
-        query_string = urllib.parse.urlparse(url).query
-        query_dict = {k: v[0] for k, v in urllib.parse.parse_qs(query_string).items()}
-
-        duplicate_keys_with_same_value = {k for k in query_dict.keys() if str(params.get(k)) == str(query_dict[k])}
-        return {k: v for k, v in params.items() if k not in duplicate_keys_with_same_value}
+        query_dict = _parse_query(url)
+        return {k: v for k, v in params.items() if k not in query_dict or str(v) != str(query_dict[k])}
 
     def _create_prepared_request(
         self,
@@ -167,7 +258,7 @@ class HttpClient:
         else:
             query_params = params or {}
         args = {"method": http_method, "url": url, "headers": headers, "params": query_params}
-        if http_method.upper() in BODY_REQUEST_METHODS:
+        if http_method in BODY_REQUEST_METHODS:
             if json and data:
                 raise RequestBodyException(
                     "At the same time only one of the 'request_body_data' and 'request_body_json' functions can return data"
@@ -180,8 +271,7 @@ class HttpClient:
 
         return prepared_request
 
-    @property
-    def _max_retries(self) -> int:
+    def _resolve_max_retries(self) -> int:
         """
         Determines the max retries based on the provided error handler.
         """
@@ -192,8 +282,7 @@ class HttpClient:
             max_retries = self._error_handler.max_retries
         return max_retries if max_retries is not None else self._DEFAULT_MAX_RETRY
 
-    @property
-    def _max_time(self) -> int:
+    def _resolve_max_time(self) -> int:
         """
         Determines the max time based on the provided error handler.
         """
@@ -217,15 +306,17 @@ class HttpClient:
             requests.Response: The HTTP response received from the server after retries.
         """
 
-        max_retries = self._max_retries
-        max_tries = max(0, max_retries) + 1
-        max_time = self._max_time
+        # The attempt count lives in this closure so that it is shared by all the retries of this request only and is released
+        # as soon as the request is done. Keeping it on the client keyed by request would grow for the lifetime of the client.
+        attempt_count = 0
+
+        def send_attempt(*args: Any, **kwargs: Any) -> requests.Response:
+            nonlocal attempt_count
+            attempt_count += 1
+            return self._send(*args, attempt_count=attempt_count, **kwargs)
 
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(self._send)
-        rate_limit_backoff_handler = rate_limit_default_backoff_handler()
-        backoff_handler = http_client_default_backoff_handler(max_tries=max_tries, max_time=max_time)
         # backoff handlers wrap _send, so it will always return a response
-        response = backoff_handler(rate_limit_backoff_handler(user_backoff_handler))(request, request_kwargs, log_formatter=log_formatter, exit_on_rate_limit=exit_on_rate_limit)  # type: ignore # mypy can't infer that backoff_handler wraps _send
+        response = self._backoff_handler(self._rate_limit_backoff_handler(self._user_backoff_handler(send_attempt)))(request, request_kwargs, log_formatter=log_formatter, exit_on_rate_limit=exit_on_rate_limit)  # type: ignore # mypy can't infer that backoff_handler wraps _send
 
         return response
 
@@ -235,16 +326,13 @@ class HttpClient:
         request_kwargs: Mapping[str, Any],
         log_formatter: Optional[Callable[[requests.Response], Any]] = None,
         exit_on_rate_limit: Optional[bool] = False,
+        attempt_count: int = 1,
     ) -> requests.Response:
 
-        if request not in self._request_attempt_count:
-            self._request_attempt_count[request] = 1
-        else:
-            self._request_attempt_count[request] += 1
-
-        self._logger.debug(
-            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
-        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
+            )
 
         response: Optional[requests.Response] = None
         exc: Optional[requests.RequestException] = None
@@ -269,13 +357,8 @@ class HttpClient:
                     "Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text}
                 )
 
-        # Request/response logging for declarative cdk
-        if log_formatter is not None and response is not None and self._message_repository is not None:
-            formatter = log_formatter
-            self._message_repository.log_message(
-                Level.DEBUG,
-                lambda: formatter(response),  # type: ignore # log_formatter is always cast to a callable
-            )
+        if response is not None:
+            self._log_response(response, log_formatter)
 
         # Emit stream status RUNNING with the reason RATE_LIMITED to log that the rate limit has been reached
         if error_resolution.response_action == ResponseAction.RATE_LIMITED:
@@ -315,14 +398,7 @@ class HttpClient:
 
         # TODO: Consider dynamic retry count depending on subsequent error codes
         elif error_resolution.response_action == ResponseAction.RETRY or error_resolution.response_action == ResponseAction.RATE_LIMITED:
-            user_defined_backoff_time = None
-            for backoff_strategy in self._backoff_strategies:
-                backoff_time = backoff_strategy.backoff_time(
-                    response_or_exception=response if response is not None else exc, attempt_count=self._request_attempt_count[request]
-                )
-                if backoff_time:
-                    user_defined_backoff_time = backoff_time
-                    break
+            user_defined_backoff_time = self._backoff_time(response if response is not None else exc, attempt_count)
             error_message = (
                 error_resolution.error_message
                 or f"Request to {request.url} failed with failure type {error_resolution.failure_type}, response action {error_resolution.response_action}."
@@ -379,8 +455,35 @@ class HttpClient:
             http_method=http_method, url=url, dedupe_query_params=dedupe_query_params, headers=headers, params=params, json=json, data=data
         )
 
+        # Streamed responses are not cached as their content can only be read once
+        cache_key = self._response_cache_key(request) if self._response_cache is not None and not request_kwargs.get("stream") else None
+        if cache_key is not None:
+            with self._response_cache_lock:
+                cached_response = self._response_cache.get(cache_key)  # type: ignore # the cache key is only set when there is a cache
+            if cached_response is not None:
+                self._log_response(cached_response, log_formatter)
+                return request, cached_response
+
         response: requests.Response = self._send_with_retry(
             request=request, request_kwargs=request_kwargs, log_formatter=log_formatter, exit_on_rate_limit=exit_on_rate_limit
         )
 
+        if cache_key is not None and response.status_code == 200:
+            with self._response_cache_lock:
+                self._response_cache[cache_key] = response  # type: ignore # the cache key is only set when there is a cache
+
         return request, response
+
+    @staticmethod
+    def _response_cache_key(request: requests.PreparedRequest) -> ResponseCacheKey:
+        # The prepared URL includes the query parameters
+        return request.method, request.url, request.body, frozenset(request.headers.items())
+
+    def _log_response(self, response: requests.Response, log_formatter: Optional[Callable[[requests.Response], Any]]) -> None:
+        # Request/response logging for declarative cdk
+        if log_formatter is not None and self._message_repository is not None:
+            formatter = log_formatter
+            self._message_repository.log_message(
+                Level.DEBUG,
+                lambda: formatter(response),  # type: ignore # log_formatter is always cast to a callable
+            )
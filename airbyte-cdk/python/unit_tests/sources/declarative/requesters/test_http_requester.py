@@ -124,7 +124,7 @@ def test_base_url_has_a_trailing_slash(test_name, base_url, expected_base_url):
         http_method=HttpMethod.GET,
         request_options_provider=MagicMock(),
         authenticator=MagicMock(),
-        error_handler=MagicMock(),
+        error_handler=MagicMock(max_retries=5, max_time=600),
         config={},
         parameters={},
     )
@@ -149,7 +149,7 @@ def test_path(test_name, path, expected_path):
         http_method=HttpMethod.GET,
         request_options_provider=MagicMock(),
         authenticator=MagicMock(),
-        error_handler=MagicMock(),
+        error_handler=MagicMock(max_retries=5, max_time=600),
         config={},
         parameters={},
     )
@@ -657,6 +657,7 @@ def test_request_attempt_count_is_tracked_across_retries(http_requester_factory)
     request_mock.method = "GET"
     request_mock.body = {}
     backoff_strategy = ConstantBackoffStrategy(parameters={}, config={}, backoff_time_in_seconds=0.1)
+    backoff_strategy.backoff_time = MagicMock(wraps=backoff_strategy.backoff_time)
     error_handler = DefaultErrorHandler(parameters={}, config={}, max_retries=1, backoff_strategies=[backoff_strategy])
     http_requester = http_requester_factory(error_handler=error_handler)
     http_requester._http_client._session.send = MagicMock()
@@ -667,7 +668,8 @@ def test_request_attempt_count_is_tracked_across_retries(http_requester_factory)
     with pytest.raises(UserDefinedBackoffException):
         http_requester._http_client._send_with_retry(request=request_mock, request_kwargs={})
 
-    assert http_requester._http_client._request_attempt_count.get(request_mock) == http_requester._http_client._max_retries + 1
+    attempt_counts = [call.kwargs["attempt_count"] for call in backoff_strategy.backoff_time.call_args_list]
+    assert attempt_counts == list(range(1, http_requester._http_client._max_retries + 2))
 
 
 @pytest.mark.usefixtures("mock_sleep")
@@ -678,6 +680,7 @@ def test_request_attempt_count_with_exponential_backoff_strategy(http_requester_
     request_mock.method = "GET"
     request_mock.body = {}
     backoff_strategy = ExponentialBackoffStrategy(parameters={}, config={}, factor=0.01)
+    backoff_strategy.backoff_time = MagicMock(wraps=backoff_strategy.backoff_time)
     error_handler = DefaultErrorHandler(parameters={}, config={}, max_retries=2, backoff_strategies=[backoff_strategy])
     http_requester = http_requester_factory(error_handler=error_handler)
     http_requester._http_client._session.send = MagicMock()
@@ -688,4 +691,5 @@ def test_request_attempt_count_with_exponential_backoff_strategy(http_requester_
     with pytest.raises(UserDefinedBackoffException):
         http_requester._http_client._send_with_retry(request=request_mock, request_kwargs={})
 
-    assert http_requester._http_client._request_attempt_count.get(request_mock) == http_requester._http_client._max_retries + 1
+    attempt_counts = [call.kwargs["attempt_count"] for call in backoff_strategy.backoff_time.call_args_list]
+    assert attempt_counts == list(range(1, http_requester._http_client._max_retries + 2))
@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import gzip
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http import HttpClient
+from airbyte_cdk.sources.streams.http.http2_adapter import Http2Adapter
+
+
+def _http_client_with_transport(handler) -> HttpClient:
+    http_client = HttpClient(name="test", logger=MagicMock(), use_http2=True)
+    adapter = http_client._session.get_adapter("https://test_base_url.com")
+    adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return http_client
+
+
+def test_use_http2_mounts_http2_adapter_for_https_only():
+    http_client = HttpClient(name="test", logger=MagicMock(), use_http2=True)
+
+    assert isinstance(http_client._session.get_adapter("https://test_base_url.com"), Http2Adapter)
+    assert not isinstance(http_client._session.get_adapter("http://test_base_url.com"), Http2Adapter)
+    assert not isinstance(HttpClient(name="test", logger=MagicMock())._session.get_adapter("https://test_base_url.com"), Http2Adapter)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_http2_adapter_returns_requests_response(stream):
+    sent_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        # an iterator is used so that the body is streamed like a network response instead of being read upfront by httpx
+        return httpx.Response(
+            200, content=iter([gzip.compress(b'{"id": 1}')]), headers={"Content-Encoding": "gzip", "Content-Type": "application/json"}
+        )
+
+    http_client = _http_client_with_transport(handler)
+    _, response = http_client.send_request(
+        http_method="post",
+        url="https://test_base_url.com/v1/endpoint",
+        params={"param": "value"},
+        json={"body": "value"},
+        request_kwargs={"stream": stream},
+    )
+
+    assert isinstance(response, requests.Response)
+    assert response.status_code == 200
+    assert response.reason == "OK"
+    assert response.json() == {"id": 1}
+    assert str(sent_requests[0].url) == "https://test_base_url.com/v1/endpoint?param=value"
+    assert sent_requests[0].content == b'{"body": "value"}'
+
+
+@pytest.mark.parametrize(
+    "httpx_exception, expected_exception",
+    [
+        pytest.param(httpx.ConnectTimeout("timeout"), requests.exceptions.ConnectTimeout, id="test_connect_timeout"),
+        pytest.param(httpx.ReadTimeout("timeout"), requests.exceptions.ReadTimeout, id="test_read_timeout"),
+        pytest.param(httpx.ConnectError("error"), requests.exceptions.ConnectionError, id="test_connection_error"),
+    ],
+)
+def test_http2_adapter_translates_transport_errors(httpx_exception, expected_exception):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx_exception
+
+    adapter = Http2Adapter(pool_maxsize=1)
+    adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+    session = requests.Session()
+    session.mount("https://", adapter)
+
+    with pytest.raises(expected_exception):
+        session.get("https://test_base_url.com/v1/endpoint")
+
+
+def test_http2_adapter_saves_cookies_into_session():
+    sent_cookies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_cookies.append(request.headers.get("Cookie"))
+        return httpx.Response(200, headers=[("Set-Cookie", "session_id=abc; Path=/"), ("Set-Cookie", "other=1; Path=/")], content=iter([b"{}"]))
+
+    http_client = _http_client_with_transport(handler)
+
+    _, first_response = http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+    http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+
+    assert first_response.cookies.get_dict() == {"session_id": "abc", "other": "1"}
+    assert http_client._session.cookies.get_dict() == {"session_id": "abc", "other": "1"}
+    assert sent_cookies[0] is None
+    assert sorted(sent_cookies[1].split("; ")) == ["other=1", "session_id=abc"]
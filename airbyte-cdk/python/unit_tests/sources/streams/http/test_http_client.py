@@ -9,11 +9,13 @@ import requests
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.streams.call_rate import CachedLimiterSession, LimiterSession
 from airbyte_cdk.sources.streams.http import HttpClient
+from airbyte_cdk.sources.streams.http.http_client import _parse_query, user_defined_backoff_handler
 from airbyte_cdk.sources.streams.http.error_handlers import BackoffStrategy, ErrorResolution, HttpStatusErrorHandler, ResponseAction
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
-from requests_cache import CachedRequest
+from requests_cache import CachedRequest, SQLiteCache
 
 
 def test_http_client():
@@ -41,6 +43,33 @@ def test_request_session_returns_valid_session(use_cache, expected_session):
     assert isinstance(http_client._request_session(), expected_session)
 
 
+def test_cache_session_backend_is_in_memory_unless_cache_path_is_set(tmp_path, monkeypatch):
+    monkeypatch.delenv(ENV_REQUEST_CACHE_PATH, raising=False)
+    assert not isinstance(HttpClient(name="test", logger=MagicMock(), use_cache=True)._session.cache, SQLiteCache)
+
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path))
+    assert isinstance(HttpClient(name="test", logger=MagicMock(), use_cache=True)._session.cache, SQLiteCache)
+
+
+def test_sqlite_cache_is_tuned_for_writes(tmp_path, monkeypatch):
+    monkeypatch.setenv(ENV_REQUEST_CACHE_PATH, str(tmp_path))
+    http_client = HttpClient(name="test", logger=MagicMock(), use_cache=True)
+
+    with http_client._session.cache.responses.connection() as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert connection.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert connection.execute("PRAGMA cache_size").fetchone()[0] == -65536
+
+
+@pytest.mark.parametrize("scheme", ["https://", "http://"])
+def test_session_mounts_adapter_with_pool_size(scheme):
+    http_client = HttpClient(name="test", logger=MagicMock(), pool_connections=5, pool_maxsize=50)
+    adapter = http_client._session.get_adapter(f"{scheme}test_base_url.com")
+    assert adapter._pool_connections == 5
+    assert adapter._pool_maxsize == 50
+
+
 @pytest.mark.parametrize(
     "deduplicate_query_params, url, params, expected_url",
     [
@@ -89,6 +118,13 @@ def test_request_session_returns_valid_session(use_cache, expected_session):
             "https://test_base_url.com/v1/endpoint?param1=1",
             id="test_duplicate_params_same_value_not_string",
         ),
+        pytest.param(
+            True,
+            "https://test_base_url.com/v1/endpoint;version=1?param1=value1",
+            {"param1": "value1"},
+            "https://test_base_url.com/v1/endpoint;version=1?param1=value1",
+            id="test_duplicate_params_with_path_parameters",
+        ),
         pytest.param(
             True,
             "https://test_base_url.com/v1/endpoint?param1=value1",
@@ -123,6 +159,20 @@ def test_duplicate_request_params_are_deduped(deduplicate_query_params, url, par
         assert prepared_request.url == expected_url
 
 
+def test_dedupe_query_params_parses_url_once():
+    http_client = test_http_client()
+    url = "https://test_base_url.com/v1/endpoint?param1=value1&param2=value2"
+    _parse_query.cache_clear()
+
+    for _ in range(3):
+        deduped_params = http_client._dedupe_query_params(url, {"param1": "value1", "param2": "other_value", "param3": "value3"})
+        assert deduped_params == {"param2": "other_value", "param3": "value3"}
+
+    assert _parse_query.cache_info().misses == 1
+    assert _parse_query.cache_info().hits == 2
+    assert _parse_query(url) == {"param1": "value1", "param2": "value2"}
+
+
 def test_create_prepared_response_given_given_both_json_and_data_raises_request_body_exception():
     http_client = test_http_client()
 
@@ -144,6 +194,21 @@ def test_create_prepared_response_given_either_json_or_data_returns_valid_reques
     assert isinstance(prepared_request, requests.PreparedRequest)
 
 
+@pytest.mark.parametrize(
+    "http_method, expected_body",
+    [
+        ("get", b'{"test": "json"}'),
+        ("POST", b'{"test": "json"}'),
+        ("patch", b'{"test": "json"}'),
+        ("DELETE", None),
+    ],
+)
+def test_create_prepared_request_only_sets_body_for_body_request_methods(http_method, expected_body):
+    http_client = test_http_client()
+    prepared_request = http_client._create_prepared_request(http_method=http_method, url="https://test_base_url.com/v1/endpoint", json={"test": "json"})
+    assert prepared_request.body == expected_body
+
+
 def test_connection_pool():
     http_client = HttpClient(name="test", logger=MagicMock(), authenticator=TokenAuthenticator("test-token"))
     assert http_client._session.adapters["https://"]._pool_connections == 20
@@ -161,6 +226,21 @@ def test_valid_basic_send_request(mocker):
     assert returned_response == mocked_response
 
 
+def test_send_request_does_not_log_requests_when_debug_is_disabled(mocker):
+    logger = MagicMock()
+    logger.isEnabledFor.return_value = False
+    http_client = HttpClient(name="test", logger=logger)
+    mocked_response = MagicMock(spec=requests.Response)
+    mocked_response.status_code = 200
+    mocked_response.headers = {}
+    mocker.patch.object(requests.Session, "send", return_value=mocked_response)
+
+    http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+
+    logger.isEnabledFor.assert_called_with(logging.DEBUG)
+    logger.debug.assert_not_called()
+
+
 def test_send_raises_airbyte_traced_exception_with_fail_response_action():
     mocked_session = MagicMock(spec=requests.Session)
     http_client = HttpClient(
@@ -265,6 +345,35 @@ def test_raises_backoff_exception_with_response_with_unmapped_error(mocker, back
         http_client._send(prepared_request, {})
 
 
+@pytest.mark.parametrize(
+        "backoff_time_values, expected_backoff_time",
+        [
+            ([None, 0.2, 0.3], 0.2),
+            ([0.1, 0.2], 0.1),
+            ([None, None], None),
+        ]
+)
+def test_backoff_time_is_the_first_one_returned_by_the_backoff_strategies(mocker, backoff_time_values, expected_backoff_time):
+    http_client = HttpClient(
+        name="test",
+        logger=MagicMock(),
+        error_handler=HttpStatusErrorHandler(logger=MagicMock()),
+        backoff_strategy=[CustomBackoffStrategy(backoff_time_value=value) for value in backoff_time_values]
+    )
+    prepared_request = requests.PreparedRequest()
+    mocked_response = MagicMock(spec=requests.Response)
+    mocked_response.status_code = 508
+    mocked_response.headers = {}
+    mocked_response.ok = False
+
+    mocker.patch.object(requests.Session, "send", return_value=mocked_response)
+
+    with pytest.raises(DefaultBackoffException if expected_backoff_time is None else UserDefinedBackoffException) as exception:
+        http_client._send(prepared_request, {})
+    if expected_backoff_time is not None:
+        assert exception.value.backoff == expected_backoff_time
+
+
 @pytest.mark.usefixtures("mock_sleep")
 def test_send_request_given_retry_response_action_retries_and_returns_valid_response():
     mocked_session = MagicMock(spec=requests.Session)
@@ -339,6 +448,94 @@ def test_that_response_was_cached(requests_mock):
     assert not requests_mock.called
 
 
+def test_in_memory_cache_is_shared_between_http_clients(requests_mock, monkeypatch):
+    monkeypatch.delenv(ENV_REQUEST_CACHE_PATH, raising=False)
+    parent_http_client = HttpClient(name="parent", logger=MagicMock(), use_cache=True)
+    parent_http_client.clear_cache()
+    requests_mock.register_uri("GET", "https://test_base_url.com/v1/endpoint", json=[1])
+
+    parent_http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+    _, response = HttpClient(name="parent", logger=MagicMock(), use_cache=True).send_request(
+        http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={}
+    )
+
+    assert requests_mock.call_count == 1
+    assert response.json() == [1]
+
+
+@pytest.mark.parametrize(
+    "use_cache, second_request_params, second_request_kwargs, expected_send_count",
+    [
+        pytest.param(True, {"page": "1"}, {}, 1, id="test_identical_request_is_answered_from_memory"),
+        pytest.param(True, {"page": "2"}, {}, 2, id="test_request_with_other_params_is_sent"),
+        pytest.param(True, {"page": "1"}, {"stream": True}, 2, id="test_streamed_request_is_sent"),
+        pytest.param(False, {"page": "1"}, {}, 2, id="test_no_response_cache_without_use_cache"),
+    ],
+)
+def test_send_request_response_cache(mocker, requests_mock, use_cache, second_request_params, second_request_kwargs, expected_send_count):
+    http_client = HttpClient(name="test", logger=MagicMock(), use_cache=use_cache)
+    if use_cache:
+        http_client._session.cache.clear()
+    requests_mock.register_uri("GET", "https://test_base_url.com/v1/endpoint", json={"test": "response"})
+    send_with_retry = mocker.spy(http_client, "_send_with_retry")
+
+    _, first_response = http_client.send_request(
+        http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={}, params={"page": "1"}
+    )
+    _, second_response = http_client.send_request(
+        http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs=second_request_kwargs, params=second_request_params
+    )
+
+    assert send_with_retry.call_count == expected_send_count
+    assert (second_response is first_response) == (expected_send_count == 1)
+    assert second_response.json() == {"test": "response"}
+
+
+def test_clear_cache_clears_response_cache(requests_mock):
+    http_client = HttpClient(name="test", logger=MagicMock(), use_cache=True)
+    http_client.clear_cache()
+    requests_mock.register_uri("GET", "https://test_base_url.com/v1/endpoint", json=[1])
+    http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+
+    http_client.clear_cache()
+    requests_mock.register_uri("GET", "https://test_base_url.com/v1/endpoint", json=[2])
+    _, response = http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+
+    assert requests_mock.call_count == 2
+    assert response.json() == [2]
+
+
+def test_send_request_response_cache_skips_unsuccessful_responses(mocker, requests_mock):
+    http_client = HttpClient(name="test", logger=MagicMock(), use_cache=True, disable_retries=True)
+    http_client._session.cache.clear()
+    requests_mock.register_uri("GET", "https://test_base_url.com/v1/endpoint", status_code=204)
+    send_with_retry = mocker.spy(http_client, "_send_with_retry")
+
+    for _ in range(2):
+        http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+
+    assert send_with_retry.call_count == 2
+
+
+def test_send_request_logs_responses_answered_from_memory():
+    message_repository = MagicMock()
+    http_client = HttpClient(name="test", logger=MagicMock(), use_cache=True, message_repository=message_repository)
+    response = MagicMock(spec=requests.Response)
+    response.status_code = 200
+    prepared_request = http_client._create_prepared_request(http_method="get", url="https://test_base_url.com/v1/endpoint")
+    http_client._response_cache[http_client._response_cache_key(prepared_request)] = response
+    log_formatter = MagicMock()
+
+    _, returned_response = http_client.send_request(
+        http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={}, log_formatter=log_formatter
+    )
+
+    assert returned_response is response
+    message_repository.log_message.assert_called_once()
+    message_repository.log_message.call_args.args[1]()
+    log_formatter.assert_called_once_with(response)
+
+
 def test_send_handles_response_action_given_session_send_raises_request_exception():
     error_resolution = ErrorResolution(ResponseAction.FAIL, FailureType.system_error, "test fail message")
 
@@ -521,3 +718,44 @@ def test_backoff_strategy_endless(exit_on_rate_limit, expected_call_count, expec
         with pytest.raises(expected_error):
             http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={}, exit_on_rate_limit=exit_on_rate_limit)
         assert mocked_send.call_count == expected_call_count
+
+
+@pytest.mark.usefixtures("mock_sleep")
+def test_attempt_count_is_not_shared_between_requests():
+    attempt_counts = []
+
+    class BackoffStrategy:
+        def backoff_time(self, *args, attempt_count, **kwargs):
+            attempt_counts.append(attempt_count)
+            return 0.001
+
+    retries = 2
+    http_client = HttpClient(name="test", logger=MagicMock(), error_handler=HttpStatusErrorHandler(logger=MagicMock(), max_retries=retries), backoff_strategy=BackoffStrategy())
+
+    mocked_response = MagicMock(spec=requests.Response)
+    mocked_response.status_code = 429
+    mocked_response.headers = {}
+    mocked_response.ok = False
+
+    with patch.object(requests.Session, "send", return_value=mocked_response):
+        for _ in range(2):
+            with pytest.raises(UserDefinedBackoffException):
+                http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+
+    assert attempt_counts == [1, 2, 3] * 2
+
+
+def test_backoff_handlers_are_built_once_per_client():
+    mocked_response = MagicMock(spec=requests.Response)
+    mocked_response.status_code = 200
+    mocked_response.headers = {}
+
+    with patch(
+        "airbyte_cdk.sources.streams.http.http_client.user_defined_backoff_handler", wraps=user_defined_backoff_handler
+    ) as mocked_backoff_handler_factory:
+        http_client = HttpClient(name="test", logger=MagicMock(), error_handler=HttpStatusErrorHandler(logger=MagicMock(), max_retries=3))
+        with patch.object(requests.Session, "send", return_value=mocked_response):
+            for _ in range(3):
+                http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
+
+    mocked_backoff_handler_factory.assert_called_once_with(max_tries=4, max_time=600)
@@ -287,6 +287,12 @@ def abstract_source(mocker):
             pytest.raises(ValidationError),
             id="test_invalid_global_state_streams_not_list",
         ),
+        pytest.param(
+            [{"type": "STREAM", "data": {}}],
+            None,
+            pytest.raises(ValueError, match="should contain either a stream, global, or state field"),
+            id="test_invalid_state_without_stream_global_or_data",
+        ),
     ],
 )
 def test_read_state(source, incoming_state, expected_state, expected_error):
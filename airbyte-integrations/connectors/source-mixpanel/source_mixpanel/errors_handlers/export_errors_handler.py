@@ -45,7 +45,7 @@ class ExportErrorHandler(MixpanelStreamErrorHandler):
                 )
             try:
                 # trying to parse response to avoid ConnectionResetError and retry if it occurs
-                self.stream.iter_dicts(response_or_exception.iter_lines(decode_unicode=True))
+                self.stream.iter_dicts(response_or_exception.iter_lines(decode_unicode=False))
             except ConnectionResetError:
                 return ErrorResolution(
                     response_action=ResponseAction.RETRY,
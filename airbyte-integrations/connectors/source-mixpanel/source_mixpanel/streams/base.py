@@ -4,9 +4,10 @@
 
 import time
 from abc import ABC
-from datetime import timedelta
+from datetime import date, timedelta
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
+import orjson
 import pendulum
 import requests
 from airbyte_cdk import BackoffStrategy
@@ -16,7 +17,7 @@ from pendulum import Date
 from requests.auth import AuthBase
 from source_mixpanel.backoff_strategy import MixpanelStreamBackoffStrategy
 from source_mixpanel.errors_handlers import MixpanelStreamErrorHandler
-from source_mixpanel.utils import fix_date_time
+from source_mixpanel.utils import SlidingWindowLimiter, fix_date_time
 
 
 class MixpanelStream(HttpStream, ABC):
@@ -27,6 +28,7 @@ class MixpanelStream(HttpStream, ABC):
     """
 
     DEFAULT_REQS_PER_HOUR_LIMIT = 60
+    RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
 
     @property
     def state_checkpoint_interval(self) -> int:
@@ -48,6 +50,13 @@ class MixpanelStream(HttpStream, ABC):
     @reqs_per_hour_limit.setter
     def reqs_per_hour_limit(self, value):
         self._reqs_per_hour_limit = value
+        self._rate_limiter = None
+
+    @property
+    def rate_limiter(self) -> SlidingWindowLimiter:
+        if self._rate_limiter is None:
+            self._rate_limiter = SlidingWindowLimiter.from_reqs_per_hour(self.reqs_per_hour_limit)
+        return self._rate_limiter
 
     def __init__(
         self,
@@ -72,6 +81,7 @@ class MixpanelStream(HttpStream, ABC):
         self.project_timezone = project_timezone
         self.project_id = project_id
         self._reqs_per_hour_limit = reqs_per_hour_limit
+        self._rate_limiter: Optional[SlidingWindowLimiter] = None
         super().__init__(authenticator=authenticator)
 
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
@@ -84,7 +94,7 @@ class MixpanelStream(HttpStream, ABC):
         return {"Accept": "application/json"}
 
     def process_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
         if self.data_field is not None:
             data = json_response.get(self.data_field, [])
         elif isinstance(json_response, list):
@@ -102,14 +112,28 @@ class MixpanelStream(HttpStream, ABC):
         stream_state: Mapping[str, Any],
         **kwargs,
     ) -> Iterable[Mapping]:
+        # the response is parsed right after it is received, so this is the time the request has been sent at
+        request_sent_at = time.monotonic() - response.elapsed.total_seconds()
+
         # parse the whole response
         yield from self.process_response(response, stream_state=stream_state, **kwargs)
 
         if self.reqs_per_hour_limit > 0:
             # we skip this block, if self.reqs_per_hour_limit = 0,
-            # in all other cases wait for X seconds to match API limitations
-            self.logger.info(f"Sleep for {3600 / self.reqs_per_hour_limit} seconds to match API limitations after reading from {self.name}")
-            time.sleep(3600 / self.reqs_per_hour_limit)
+            # in all other cases wait until the next request fits in the API limitations
+            self.rate_limiter.register_request(request_sent_at)
+            if self._has_remaining_quota(response):
+                return
+            wait_time = self.rate_limiter.wait_if_throttled()
+            if wait_time:
+                self.logger.info(f"Slept for {wait_time:.2f} seconds to match API limitations after reading from {self.name}")
+
+    def _has_remaining_quota(self, response: requests.Response) -> bool:
+        """
+        Mixpanel may report the quota left for the current period, in which case there is no need to wait before the next request
+        """
+        remaining = response.headers.get(self.RATE_LIMIT_REMAINING_HEADER)
+        return remaining is not None and remaining.isdigit() and int(remaining) > 0
 
     def get_backoff_strategy(self) -> Optional[Union[BackoffStrategy, List[BackoffStrategy]]]:
         return MixpanelStreamBackoffStrategy(stream=self)
@@ -174,19 +198,28 @@ class DateSlicesMixin:
         # end_date cannot be later than today
         end_date = min(self.end_date, pendulum.today(tz=self.project_timezone).date())
 
-        while start_date <= end_date:
-            if self._timezone_mismatch:
-                return
-            current_end_date = start_date + timedelta(days=self.date_window_size - 1)  # -1 is needed because dates are inclusive
-            stream_slice = {
-                "start_date": str(start_date),
-                "end_date": str(min(current_end_date, end_date)),
-            }
+        # materialize the slices of the other mixins once as they are combined with every date slice
+        parent_slices = list(super().stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state))
+
+        for date_slice in self.date_slices(start_date, end_date):
             if cursor_value:
-                stream_slice[self.cursor_field] = cursor_value
-            yield stream_slice
-            # add 1 additional day because date range is inclusive
-            start_date = current_end_date + timedelta(days=1)
+                date_slice[self.cursor_field] = cursor_value
+            for parent_slice in parent_slices:
+                if self._timezone_mismatch:
+                    return
+                # yield a new dict for each combination so that consumers can keep references to the slices
+                yield {**date_slice, **parent_slice} if parent_slice else date_slice
+
+    def date_slices(self, start_date: date, end_date: date) -> Iterable[MutableMapping[str, str]]:
+        """
+        Split the inclusive [start_date, end_date] range into windows of date_window_size days.
+        Bounds are computed on day ordinals to avoid creating timedelta and intermediate date objects for each window.
+        """
+        start, end, window = start_date.toordinal(), end_date.toordinal(), self.date_window_size
+        for window_start in range(start, end + 1, window):
+            # -1 is needed because dates are inclusive
+            window_end = min(window_start + window - 1, end)
+            yield {"start_date": str(date.fromordinal(window_start)), "end_date": str(date.fromordinal(window_end))}
 
     def request_params(
         self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, any] = None, next_page_token: Mapping[str, Any] = None
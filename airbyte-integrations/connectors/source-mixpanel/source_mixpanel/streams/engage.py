@@ -4,6 +4,7 @@
 
 from typing import Iterable, Mapping
 
+import orjson
 import requests
 
 from .base import MixpanelStream
@@ -45,7 +46,7 @@ class EngageSchema(MixpanelStream):
             }
         }
         """
-        records = response.json().get(self.data_field, {})
+        records = orjson.loads(response.content).get(self.data_field, {})
         for property_name in records:
             yield {
                 "name": property_name,
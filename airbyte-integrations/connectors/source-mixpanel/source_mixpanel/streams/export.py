@@ -6,6 +6,7 @@ import json
 from functools import cache
 from typing import Any, Iterable, Mapping, MutableMapping, Optional
 
+import orjson
 import pendulum
 import requests
 from airbyte_cdk.models import SyncMode
@@ -60,7 +61,7 @@ class ExportSchema(MixpanelStream):
             "$origin_start": {}
         }
         """
-        records = response.json()
+        records = orjson.loads(response.content)
         for property_name in records:
             yield property_name
 
@@ -93,19 +94,19 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
     def get_error_handler(self) -> Optional[ErrorHandler]:
         return ExportErrorHandler(logger=self.logger, stream=self)
 
-    def iter_dicts(self, lines):
+    def iter_dicts(self, lines: Iterable[bytes]):
         """
-        The incoming stream has to be JSON lines format.
+        The incoming stream has to be JSON lines format, as bytes.
         From time to time for some reason, the one record can be split into multiple lines.
         We try to combine such split parts into one record only if parts go nearby.
         """
         parts = []
         for record_line in lines:
-            if record_line == "terminated early":
-                self.logger.warning(f"Couldn't fetch data from Export API. Response: {record_line}")
+            if record_line == b"terminated early":
+                self.logger.warning(f"Couldn't fetch data from Export API. Response: {record_line.decode()}")
                 return
             try:
-                yield json.loads(record_line)
+                yield self._loads(record_line)
             except ValueError:
                 parts.append(record_line)
             else:
@@ -113,12 +114,20 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
 
             if len(parts) > 1:
                 try:
-                    yield json.loads("".join(parts))
+                    yield self._loads(b"".join(parts))
                 except ValueError:
                     pass
                 else:
                     parts = []
 
+    @staticmethod
+    def _loads(record_line: bytes) -> Any:
+        try:
+            return orjson.loads(record_line)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN, Infinity and lone surrogate escapes which json accepts, only a line both reject is a partial record
+            return json.loads(record_line)
+
     def process_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
         """Export API return response in JSONL format but each line is a valid JSON object
         Raw item example:
@@ -139,8 +148,9 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
             }
         """
 
-        # We prefer response.iter_lines() to response.text.split_lines() as the later can missparse text properties embeding linebreaks
-        for record in self.iter_dicts(response.iter_lines(decode_unicode=True)):
+        # We prefer response.iter_lines() to response.text.split_lines() as the later can missparse text properties embeding linebreaks.
+        # Lines are kept as bytes as orjson parses them directly, without decoding each line to str first
+        for record in self.iter_dicts(response.iter_lines(decode_unicode=False)):
             # transform record into flat dict structure
             item = {"event": record["event"]}
             properties = record["properties"]
@@ -2,7 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import math
 import re
+import time
+from collections import deque
+from typing import Deque, Optional
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams import Stream
@@ -61,3 +65,43 @@ def fix_date_time(record):
     elif isinstance(record, list):
         for entry in record:
             fix_date_time(entry)
+
+
+class SlidingWindowLimiter:
+    """
+    Allow at most `max_requests` requests within any window of `window_seconds` seconds.
+
+    Unlike sleeping for a fixed amount of time after each response, the time already spent waiting for the previous
+    requests counts toward the window, so there is no wait at all when the requests are slower than the limit.
+    """
+
+    def __init__(self, max_requests: int, window_seconds: float):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._timestamps: Deque[float] = deque()
+
+    @classmethod
+    def from_reqs_per_hour(cls, reqs_per_hour_limit: int) -> "SlidingWindowLimiter":
+        """
+        Spread the hourly limit over windows of about a minute so that the requests are not sent in bursts.
+        """
+        max_requests = math.ceil(reqs_per_hour_limit / 60)
+        return cls(max_requests=max_requests, window_seconds=max_requests * 3600 / reqs_per_hour_limit)
+
+    def register_request(self, timestamp: Optional[float] = None) -> None:
+        self._timestamps.append(time.monotonic() if timestamp is None else timestamp)
+
+    def wait_if_throttled(self) -> float:
+        """
+        Sleep until a new request fits in the window.
+
+        :return: the number of seconds slept
+        """
+        now = time.monotonic()
+        while self._timestamps and self._timestamps[0] <= now - self.window_seconds:
+            self._timestamps.popleft()
+        if len(self._timestamps) < self.max_requests:
+            return 0
+        wait_time = self._timestamps[0] + self.window_seconds - now
+        time.sleep(wait_time)
+        return wait_time
@@ -48,7 +48,8 @@ os.environ["REQUEST_CACHE_PATH"] = ENV_REQUEST_CACHE_PATH
 def delete_cache_files(cache_directory):
     directory_path = Path(cache_directory)
     if directory_path.exists() and directory_path.is_dir():
-        for file_path in directory_path.glob("*.sqlite"):
+        # The caches use SQLite WAL mode, so the -wal and -shm files next to each database are removed along with it
+        for file_path in directory_path.glob("*.sqlite*"):
             file_path.unlink()
 
 @pytest.fixture(autouse=True)
@@ -4,6 +4,7 @@
 
 import json
 import logging
+import math
 from datetime import timedelta
 from unittest.mock import MagicMock
 
@@ -14,6 +15,7 @@ from airbyte_cdk.sources.declarative.types import StreamSlice
 from airbyte_cdk.utils import AirbyteTracedException
 from source_mixpanel import SourceMixpanel
 from source_mixpanel.streams import EngageSchema, Export, ExportSchema, IncrementalMixpanelStream, MixpanelStream
+from source_mixpanel.streams.base import DateSlicesMixin
 from source_mixpanel.utils import read_full_refresh
 
 from .utils import get_url_to_mock, read_incremental, setup_response
@@ -68,6 +70,79 @@ def test_updated_state(patch_incremental_base_class, config):
     assert updated_state == {"date": "2021-02-25T00:00:00Z"}
 
 
+@pytest.mark.parametrize(
+    "rate_limit_remaining, expected_sleep_time",
+    [
+        pytest.param(None, 55, id="test_waits_for_the_window_without_rate_limit_header"),
+        pytest.param("0", 55, id="test_waits_for_the_window_when_no_request_remains"),
+        pytest.param("3", None, id="test_does_not_wait_when_requests_remain"),
+    ],
+)
+def test_parse_response_paces_requests(mocker, patch_base_class, config, rate_limit_remaining, expected_sleep_time):
+    stream = MixpanelStream(authenticator=MagicMock(), **config)
+    mocker.patch.object(MixpanelStream, "process_response", return_value=iter([]))
+    mocker.patch("time.monotonic", return_value=100)
+    sleep_mock = mocker.patch("time.sleep")
+    response = MagicMock(headers={} if rate_limit_remaining is None else {"X-RateLimit-Remaining": rate_limit_remaining})
+    response.elapsed = timedelta(seconds=5)
+
+    list(stream.parse_response(response, stream_state={}))
+
+    # the request is counted from the time it was sent at, 5 seconds before its response is parsed, and 60 requests
+    # per hour allow one request per minute
+    assert list(stream.rate_limiter._timestamps) == [95]
+    if expected_sleep_time is None:
+        sleep_mock.assert_not_called()
+    else:
+        sleep_mock.assert_called_once_with(expected_sleep_time)
+
+
+def test_parse_response_does_not_pace_requests_without_limit(mocker, patch_base_class, config):
+    stream = MixpanelStream(authenticator=MagicMock(), reqs_per_hour_limit=0, **config)
+    mocker.patch.object(MixpanelStream, "process_response", return_value=iter([]))
+    sleep_mock = mocker.patch("time.sleep")
+    response = MagicMock(headers={})
+    response.elapsed = timedelta(seconds=5)
+
+    list(stream.parse_response(response, stream_state={}))
+
+    sleep_mock.assert_not_called()
+    assert stream._rate_limiter is None
+
+
+class ParentSlicesMixin:
+    def stream_slices(self, **kwargs):
+        # a generator can only be iterated once, so it has to be materialized to be combined with every date slice
+        yield {"cohort_id": 1}
+        yield {"cohort_id": 2}
+        yield {"cohort_id": 3}
+
+
+class DateSlicesWithParentStream(DateSlicesMixin, ParentSlicesMixin):
+    cursor_field = None
+    date_window_size = 10
+    attribution_window = 0
+    project_timezone = "UTC"
+
+
+def test_date_slices_are_combined_with_every_parent_slice(start_date):
+    stream = DateSlicesWithParentStream()
+    stream.start_date = start_date
+    stream.end_date = start_date.add(days=19)
+
+    slices = list(stream.stream_slices(sync_mode=SyncMode.full_refresh))
+
+    assert slices == [
+        {"start_date": "2024-01-25", "end_date": "2024-02-03", "cohort_id": 1},
+        {"start_date": "2024-01-25", "end_date": "2024-02-03", "cohort_id": 2},
+        {"start_date": "2024-01-25", "end_date": "2024-02-03", "cohort_id": 3},
+        {"start_date": "2024-02-04", "end_date": "2024-02-13", "cohort_id": 1},
+        {"start_date": "2024-02-04", "end_date": "2024-02-13", "cohort_id": 2},
+        {"start_date": "2024-02-04", "end_date": "2024-02-13", "cohort_id": 3},
+    ]
+    assert len({id(stream_slice) for stream_slice in slices}) == len(slices)
+
+
 @pytest.fixture
 def cohorts_response():
     return setup_response(
@@ -778,9 +853,22 @@ def test_export_terminated_early(requests_mock, config):
 def test_export_iter_dicts(config):
     stream = Export(authenticator=MagicMock(), **config)
     record = {"key1": "value1", "key2": "value2"}
-    record_string = json.dumps(record)
+    record_string = json.dumps(record).encode()
     assert list(stream.iter_dicts([record_string, record_string])) == [record, record]
     # combine record from 2 standing nearby parts
     assert list(stream.iter_dicts([record_string, record_string[:2], record_string[2:], record_string])) == [record, record, record]
     # drop record parts because they are not standing nearby
     assert list(stream.iter_dicts([record_string, record_string[:2], record_string, record_string[2:]])) == [record, record]
+
+
+def test_export_iter_dicts_keeps_records_rejected_by_orjson(config):
+    stream = Export(authenticator=MagicMock(), **config)
+    lines = [b'{"key": NaN}', b'{"key": Infinity}', b'{"key": "\\ud800"}', b'{"key": "value"}']
+
+    records = list(stream.iter_dicts(lines))
+
+    assert len(records) == 4
+    assert math.isnan(records[0]["key"])
+    assert records[1] == {"key": math.inf}
+    assert records[2] == {"key": "\ud800"}
+    assert records[3] == {"key": "value"}
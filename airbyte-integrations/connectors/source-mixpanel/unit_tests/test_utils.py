@@ -3,7 +3,7 @@
 #
 
 import pytest
-from source_mixpanel.utils import fix_date_time
+from source_mixpanel.utils import SlidingWindowLimiter, fix_date_time
 
 
 @pytest.mark.parametrize(
@@ -44,3 +44,67 @@ from source_mixpanel.utils import fix_date_time
 def test_fix_date_time(input_record, expected_record):
     fix_date_time(input_record)
     assert input_record == expected_record
+
+
+@pytest.fixture
+def monotonic_mock(mocker):
+    return mocker.patch("source_mixpanel.utils.time.monotonic")
+
+
+@pytest.fixture
+def sleep_mock(mocker):
+    return mocker.patch("source_mixpanel.utils.time.sleep")
+
+
+@pytest.mark.parametrize(
+    "reqs_per_hour_limit, expected_max_requests, expected_window_seconds",
+    [
+        (60, 1, 60),
+        (30, 1, 120),
+        (100, 2, 72),
+        (3600, 60, 60),
+    ],
+)
+def test_sliding_window_limiter_from_reqs_per_hour(reqs_per_hour_limit, expected_max_requests, expected_window_seconds):
+    limiter = SlidingWindowLimiter.from_reqs_per_hour(reqs_per_hour_limit)
+    assert limiter.max_requests == expected_max_requests
+    assert limiter.window_seconds == pytest.approx(expected_window_seconds)
+
+
+def test_sliding_window_limiter_does_not_wait_below_max_requests(monotonic_mock, sleep_mock):
+    limiter = SlidingWindowLimiter(max_requests=2, window_seconds=60)
+    limiter.register_request(0)
+    monotonic_mock.return_value = 10
+
+    assert limiter.wait_if_throttled() == 0
+    sleep_mock.assert_not_called()
+
+
+def test_sliding_window_limiter_waits_until_oldest_request_leaves_window(monotonic_mock, sleep_mock):
+    limiter = SlidingWindowLimiter(max_requests=2, window_seconds=60)
+    limiter.register_request(0)
+    limiter.register_request(10)
+    monotonic_mock.return_value = 30
+
+    assert limiter.wait_if_throttled() == 30
+    sleep_mock.assert_called_once_with(30)
+
+
+def test_sliding_window_limiter_evicts_requests_out_of_window(monotonic_mock, sleep_mock):
+    limiter = SlidingWindowLimiter(max_requests=2, window_seconds=60)
+    limiter.register_request(0)
+    limiter.register_request(5)
+    monotonic_mock.return_value = 64
+
+    assert limiter.wait_if_throttled() == 0
+    sleep_mock.assert_not_called()
+    assert list(limiter._timestamps) == [5]
+
+
+def test_sliding_window_limiter_registers_current_time_by_default(monotonic_mock):
+    limiter = SlidingWindowLimiter(max_requests=1, window_seconds=60)
+    monotonic_mock.return_value = 42
+
+    limiter.register_request()
+
+    assert list(limiter._timestamps) == [42]